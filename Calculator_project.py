@@ -4,15 +4,475 @@ import tkinter as tk
 # Import math to perform mathematical operations such as roots and trigonometric functions:
 import math
 
-# Import re (Regular Expressions) to detect and transform mathematical patterns
-# such as square roots and scientific functions into valid Python expressions:
-import re
+# Import sys for the float precision (sys.float_info.epsilon):
+import sys
+
+# Import lru_cache to remember the value of recently evaluated expressions,
+# and partial to bind each button's text to its command without a lambda:
+from functools import lru_cache, partial
+
+# Import OrderedDict to keep the results of recent calculations in least recently used order:
+from collections import OrderedDict
+
+# Import operator to look up the Python operation for each operator symbol:
+import operator
+
+
+# =====================
+# Degree-based scientific functions
+# =====================
+
+# Python's math.sin, math.cos, math.tan work with radians
+# But calculators typically use degrees for user convenience
+# So the names sin, cos, tan in an expression mean these wrappers:
+# degrees → radians → calculate → result
+# The inverse functions (asin, acos, atan) return radians,
+# so their result is converted back to degrees
+#
+# Because the meaning lives in the function itself, the expression text
+# never has to be rewritten for it, and arguments may contain anything
+# (nested parentheses, other functions): sin(asin(0.5)) = 0.5
+#
+# The conversion is a multiplication by a precomputed constant, which gives
+# exactly the same result as math.radians / math.degrees without the extra
+# function call.
+
+_DEG2RAD = math.pi / 180    # degrees → radians (0.017453292519943295)
+_RAD2DEG = 180 / math.pi    # radians → degrees (57.29577951308232)
+
+# Most angles typed on a calculator are whole degrees (sin(30), cos(45),
+# tan(60)), so sin, cos and tan of every whole degree from 0 to 359 are
+# computed once here: for such an argument the result is a single table
+# lookup, and it is the same value the formula would give. Every other
+# argument (negative, 360 or more, or not whole) uses the formula directly,
+# so odd symmetry is kept: sin(-30) is exactly -sin(30).
+_SIN_TABLE = tuple(math.sin(d * _DEG2RAD) for d in range(360))
+_COS_TABLE = tuple(math.cos(d * _DEG2RAD) for d in range(360))
+_TAN_TABLE = tuple(math.tan(d * _DEG2RAD) for d in range(360))
+
+
+def _sin_deg(x):
+    """sin(x) with x in degrees, e.g. sin(30) = 0.5"""
+    if type(x) is int and 0 <= x < 360:
+        return _SIN_TABLE[x]
+    return math.sin(x * _DEG2RAD)
+
+
+def _cos_deg(x):
+    """cos(x) with x in degrees, e.g. cos(60) = 0.5"""
+    if type(x) is int and 0 <= x < 360:
+        return _COS_TABLE[x]
+    return math.cos(x * _DEG2RAD)
+
+
+def _tan_deg(x):
+    """tan(x) with x in degrees, e.g. tan(45) = 1.0"""
+    if type(x) is int and 0 <= x < 360:
+        return _TAN_TABLE[x]
+    return math.tan(x * _DEG2RAD)
+
+
+# Rounding in a chained calculation can push a value that should be exactly
+# 1 or -1 just outside the domain of asin/acos: sin(8)^2+cos(8)^2 gives
+# 1.0000000000000002, so asin(sin(8)^2+cos(8)^2) would fail.
+# Arguments within a few units in the last place of ±1 are treated as ±1;
+# anything further out (such as a typed asin(1.0000000000001)) is a real
+# domain error and still raises ValueError.
+_UNIT_LIMIT = 1 + 4 * sys.float_info.epsilon
+
+
+def _asin_deg(x):
+    """asin(x) with the result in degrees, e.g. asin(0.5) = 30.0"""
+    if 1 < abs(x) <= _UNIT_LIMIT:
+        x = math.copysign(1.0, x)
+    return math.asin(x) * _RAD2DEG
+
+
+def _acos_deg(x):
+    """acos(x) with the result in degrees, e.g. acos(0.5) = 60.0"""
+    if 1 < abs(x) <= _UNIT_LIMIT:
+        x = math.copysign(1.0, x)
+    return math.acos(x) * _RAD2DEG
+
+
+def _atan_deg(x):
+    """atan(x) with the result in degrees, e.g. atan(1) = 45.0"""
+    return math.atan(x) * _RAD2DEG
+
+
+def _root(n, x):
+    """
+    nth root of x, written √(n,x)
+    
+    Mathematical formula: nth root of x = x^(1/n)
+    
+    Examples:
+    ---------
+    √(3,27) → _root(3, 27) → 3.0 (cube root of 27)
+    √(2,16) → _root(2, 16) → 4.0 (square root of 16)
+    """
+    return x ** (1 / n)
+
+
+# =====================
+# Expression evaluator
+# =====================
+
+# Names that an expression is allowed to use.
+# The calculator's function names map straight to the functions that work
+# the way the calculator does (degrees for trigonometry, base 10 for log).
+# Any other name is rejected with a NameError.
+_EVAL_GLOBALS = {
+    'sin': _sin_deg,
+    'cos': _cos_deg,
+    'tan': _tan_deg,
+    'asin': _asin_deg,
+    'acos': _acos_deg,
+    'atan': _atan_deg,
+    'log': math.log10,      # log(100) = 2.0 (because 10² = 100)
+    'sqrt': math.sqrt,
+    'pi': math.pi,
+}
+
+# An expression is not rewritten into Python and run with eval(). Instead,
+# _Parser reads the calculator notation (×, ÷, ^, √, sin, ...) once from
+# left to right and computes the value while it reads; _evaluate caches
+# the value, so a repeated expression is not read again.
+#
+# This needs no regular expressions and no Python compiler, and an
+# expression can only ever do arithmetic and call the functions listed
+# in _EVAL_GLOBALS.
+
+# Operator symbols (calculator and Python spelling) → the Python operation
+_ADD_OPERATORS = {'+': operator.add, '-': operator.sub}
+_MUL_OPERATORS = {'×': operator.mul, '*': operator.mul,
+                  '÷': operator.truediv, '/': operator.truediv}
+
+# Characters that can appear in a number literal / a name
+_DIGITS = frozenset("0123456789")
+_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789")
+
+# Characters that continue a number or a name: if whitespace separates two
+# of them, removing it would merge two tokens ("2 3" would become 23)
+_WORD_CHARS = _NAME_CHARS | {"."}
+
+
+def _canonicalize(expr):
+    """
+    Return the canonical form of an expression: the same text without
+    any whitespace
+    
+    The value cache (_evaluate) is keyed on the expression text,
+    so "1+1", "1 + 1" and " 1+1 " must be the same key to share one entry.
+    Numbers are not rewritten ("1.0" stays "1.0"), because 1.0 and 1
+    are displayed differently.
+    
+    Whitespace may only separate tokens that stay separate without it:
+    "2 3", "1 .5" or "2* *3" are invalid, like in Python, instead of
+    turning into 23, 1.5 or 2**3.
+    
+    Raises:
+    -------
+    SyntaxError
+        If whitespace separates two parts of a number, a name, or "**"
+    
+    Example:
+    --------
+    " √ 25 × 2 " → "√25×2"
+    """
+    pieces = expr.split()
+    for before, after in zip(pieces, pieces[1:]):
+        last, first = before[-1], after[0]
+        if (last in _WORD_CHARS and first in _WORD_CHARS) or last == first == "*":
+            raise SyntaxError(f"invalid expression: {expr!r}")
+    return "".join(pieces)
+
+
+class _Parser:
+    """
+    Recursive-descent evaluator for calculator notation
+    
+    Each grammar rule is one method; rules lower in the list bind tighter:
+    
+        expr   := term (('+' | '-') term)*
+        term   := unary (('×' | '*' | '÷' | '/') unary)*
+        unary  := ('-' | '+') unary | power
+        power  := atom (('^' | '**') unary)?
+        atom   := number | constant | function '(' expr (',' expr)* ')'
+                | '(' expr ')' | '√' '(' expr [',' expr] ')' | '√' atom
+    
+    So, like in Python, -2^2 is -(2^2) = -4, 2^-1 is 0.5 and 2^3^2 is
+    2^(3^2) = 512. Every method returns the value of its part of the
+    expression, so reading and computing happen in the same single pass
+    over the text.
+    
+    The expression must not contain whitespace (see _canonicalize).
+    """
+    
+    def __init__(self, expr):
+        """
+        Parameters:
+        -----------
+        expr : str
+            Canonical calculator expression (e.g., "2×√(3,27)")
+        """
+        self.expr = expr
+        self.pos = 0            # Index of the next unread character
+    
+    def parse(self):
+        """
+        Evaluate the whole expression
+        
+        Returns:
+        --------
+        result : int, float or complex
+            The value of the expression
+        
+        Raises:
+        -------
+        SyntaxError
+            If the expression is not valid (e.g., "2×", "(1", "1.2.3")
+        NameError
+            If the expression uses a name that is not in _EVAL_GLOBALS
+        ZeroDivisionError, OverflowError, ValueError, TypeError
+            The same errors Python raises for an operation or function,
+            as soon as it is reached (so "1÷0)" raises ZeroDivisionError)
+        """
+        try:
+            result = self.parse_expr()
+        except RecursionError:
+            # Only reachable with hundreds of nested parentheses
+            raise SyntaxError(f"expression is nested too deeply: {self.expr!r}") from None
+        if self.pos != len(self.expr):
+            self.error()
+        return result
+    
+    # ---- helpers ----
+    
+    def error(self):
+        raise SyntaxError(f"invalid expression: {self.expr!r}")
+    
+    def peek(self):
+        """Return the next unread character ('' at the end)"""
+        return self.expr[self.pos:self.pos + 1]
+    
+    def expect(self, char):
+        """Read char, or fail if the next character is something else"""
+        if self.peek() != char:
+            self.error()
+        self.pos += 1
+    
+    # ---- grammar rules ----
+    
+    def parse_expr(self):
+        """expr := term (('+' | '-') term)*"""
+        value = self.parse_term()
+        while self.peek() in _ADD_OPERATORS:
+            operation = _ADD_OPERATORS[self.peek()]
+            self.pos += 1
+            value = operation(value, self.parse_term())
+        return value
+    
+    def parse_term(self):
+        """term := unary (('×' | '*' | '÷' | '/') unary)*"""
+        value = self.parse_unary()
+        while self.peek() in _MUL_OPERATORS:
+            operation = _MUL_OPERATORS[self.peek()]
+            self.pos += 1
+            value = operation(value, self.parse_unary())
+        return value
+    
+    def parse_unary(self):
+        """unary := ('-' | '+') unary | power"""
+        char = self.peek()
+        if char == "-":
+            self.pos += 1
+            return -self.parse_unary()
+        elif char == "+":
+            self.pos += 1
+            return self.parse_unary()
+        return self.parse_power()
+    
+    def parse_power(self):
+        """power := atom (('^' | '**') unary)?"""
+        base = self.parse_atom()
+        if self.peek() == "^":
+            self.pos += 1
+        elif self.expr.startswith("**", self.pos):
+            self.pos += 2
+        else:
+            return base
+        # The exponent may have its own sign and power: 2^-1, 2^3^2
+        return base ** self.parse_unary()
+    
+    def parse_atom(self):
+        """atom := number | name | '(' expr ')' | '√' ..."""
+        char = self.peek()
+        if char in _DIGITS or char == ".":
+            return self.parse_number()
+        elif char == "(":
+            self.pos += 1
+            value = self.parse_expr()
+            self.expect(")")
+            return value
+        elif char == "√":
+            self.pos += 1
+            return self.parse_root()
+        elif char in _NAME_CHARS:
+            return self.parse_name()
+        self.error()
+    
+    def parse_number(self):
+        """Number literal: 25, 2.5, 2., .5, 1e3, 1.5e-7"""
+        expr = self.expr
+        end = len(expr)
+        start = pos = self.pos
+        while pos < end and expr[pos] in _DIGITS:
+            pos += 1
+        is_float = pos < end and expr[pos] == "."
+        if is_float:
+            pos += 1
+            while pos < end and expr[pos] in _DIGITS:
+                pos += 1
+        if pos - start == 1 and is_float:
+            self.error()            # A lone "."
+        
+        # Exponent, e.g. the "e+20" of a result like 1e+20 reused with Ans
+        if pos < end and expr[pos] in "eE":
+            digits = pos + 1
+            if digits < end and expr[digits] in "+-":
+                digits += 1
+            if digits < end and expr[digits] in _DIGITS:
+                pos = digits
+                while pos < end and expr[pos] in _DIGITS:
+                    pos += 1
+                is_float = True
+        
+        self.pos = pos
+        text = expr[start:pos]
+        # Keep integers as int so results match normal Python arithmetic
+        return float(text) if is_float else int(text)
+    
+    def parse_name(self):
+        """Constant (pi) or function call (sin(30), log(100), ...)"""
+        expr = self.expr
+        end = len(expr)
+        start = pos = self.pos
+        while pos < end and expr[pos] in _NAME_CHARS:
+            pos += 1
+        self.pos = pos
+        name = expr[start:pos]
+        if name not in _EVAL_GLOBALS:
+            raise NameError(f"name {name!r} is not defined")
+        
+        value = _EVAL_GLOBALS[name]
+        if callable(value):
+            return value(*self.parse_arguments())
+        return value
+    
+    def parse_arguments(self):
+        """'(' expr (',' expr)* ')' → list of the argument values"""
+        self.expect("(")
+        arguments = [self.parse_expr()]
+        while self.peek() == ",":
+            self.pos += 1
+            arguments.append(self.parse_expr())
+        self.expect(")")
+        return arguments
+    
+    def parse_root(self):
+        """
+        The part after a '√':
+        - √(n,x) : nth root of x, x^(1/n)
+        - √(x)   : square root
+        - √x     : square root of a number, constant or nested root
+        """
+        if self.peek() != "(":
+            return math.sqrt(self.parse_atom())
+        
+        self.pos += 1
+        value = self.parse_expr()
+        if self.peek() != ",":
+            # √(x)
+            self.expect(")")
+            return math.sqrt(value)
+        
+        # √(n,x): value is the degree n, x follows after the comma
+        self.pos += 1
+        radicand = self.parse_expr()
+        self.expect(")")
+        return _root(value, radicand)
+
+
+@lru_cache(maxsize=256)
+def _evaluate(expr):
+    """
+    Evaluate a canonical calculator expression
+    
+    The value is cached, so pressing '=' again on the same expression
+    does not read it again. Errors are not cached: an invalid expression
+    raises its error every time. See _Parser for the grammar.
+    
+    Parameters:
+    -----------
+    expr : str
+        Canonical calculator expression (e.g., "2×(3+4)")
+    
+    Returns:
+    --------
+    result : int, float or complex
+        The value of the expression
+    
+    Raises:
+    -------
+    SyntaxError, NameError
+        If the expression is not valid
+    ZeroDivisionError, OverflowError, ValueError, TypeError
+        If an operation or function fails (e.g. "2÷0", "√(-1)")
+    
+    Example:
+    --------
+    "2×(3+4)" → 14
+    """
+    return _Parser(expr).parse()
 
 
 # =====================
 # Calculation Engine Class
 # =====================
 
+# Number of recent results CalculatorEngine remembers (see calculate)
+_RESULT_CACHE_SIZE = 128
+
+# Whole-number float results up to this size are shown without ".0"
+# (5.0 is shown as 5); beyond it a float is no longer exact as an integer
+_MAX_INTEGRAL_FLOAT = 2 ** 53
+
+
+def _format_result(result):
+    """
+    Convert a calculation result to the text shown on the display
+    
+    The text is also what Ans and the next key press continue from, so it
+    must keep the full precision of the result: integers are shown exactly
+    (2^100 keeps all its digits), and floats with repr(), the shortest text
+    that reads back as the same float. Whole-number floats are shown
+    without ".0".
+    
+    Examples:
+    ---------
+    8                   → "8"
+    5.0                 → "5"
+    0.49999999999999994 → "0.49999999999999994"
+    2e+20               → "2e+20"
+    """
+    if type(result) is float and result.is_integer() and abs(result) <= _MAX_INTEGRAL_FLOAT:
+        return str(int(result))
+    if type(result) is int:
+        return str(result)
+    return repr(result)
+
+
 class CalculatorEngine:
     """
     Calculator Engine Class - Handles all mathematical calculations
@@ -25,26 +485,128 @@ class CalculatorEngine:
     - Displaying results or error messages on the screen
     """
     
-    def __init__(self, display):
+    # The engine's attributes are fixed (see __init__), so they are stored
+    # in slots instead of a per-instance __dict__: smaller instances and
+    # slightly faster attribute access on every key press
+    __slots__ = ("display", "display_var", "last_answer", "_result_cache", "_buffer")
+    
+    def __init__(self, display, display_var=None):
         """
         Initialize the Calculator Engine
         
         Parameters:
         -----------
-        display : tk.Entry
+        display : tk.Entry or None
             Reference to the calculator's display screen widget
             This allows the engine to read input and show results
+            None runs the engine headless (e.g. in the tests): no Tk
+            objects are needed or touched, results are only kept in
+            the expression buffer and last_answer
+        display_var : tk.StringVar, optional
+            The variable holding the display's text (its textvariable)
+            Used to replace the whole text with a single call;
+            without it the text is replaced with display.delete/insert
         
         Attributes:
         -----------
-        self.display : tk.Entry
+        self.display : tk.Entry or None
             The display screen where expressions and results appear
+        self.display_var : tk.StringVar or None
+            The text variable of the display
         self.last_answer : str
             Stores the most recent calculation result
             Used by the "Ans" button to recall previous answers
+        self._result_cache : OrderedDict
+            Results of the most recent calculations (expression → value),
+            reused if the same expression is calculated again
+        self._buffer : list of str
+            The expression shown on the display, kept in Python as the
+            pieces that were entered (e.g. ["5", "×", "sin("]), so that
+            calculate() does not have to read it back from the display
         """
         self.display = display      # Reference to the display screen
+        self.display_var = display_var  # Text of the display screen
         self.last_answer = ""       # Initialize empty (no previous calculation yet)
+        self._result_cache = OrderedDict()  # No expression calculated yet
+        self._buffer = []           # Nothing entered yet
+    
+    
+    # =====================
+    # Input buffer methods
+    # =====================
+    
+    def append_input(self, text):
+        """
+        Add text to the end of the expression buffer
+        
+        Parameters:
+        -----------
+        text : str
+            The text that was added to the display (e.g., "7", "sin(")
+        """
+        self._buffer.append(text)
+    
+    
+    def remove_input(self, count=1):
+        """
+        Remove the last characters of the expression buffer
+        
+        Characters are counted in the text, not in the pieces that were
+        entered, so removing 1 character from ["5", "sin("] leaves "5sin".
+        
+        Parameters:
+        -----------
+        count : int, optional
+            Number of characters to remove (default: 1)
+        """
+        buffer = self._buffer
+        while count > 0 and buffer:
+            piece = buffer.pop()
+            if len(piece) > count:
+                # Only part of this piece is removed
+                buffer.append(piece[:-count])
+                return
+            count -= len(piece)
+    
+    
+    def clear_input(self):
+        """Remove everything from the expression buffer and the display"""
+        self._set_display("")
+    
+    
+    def input_text(self):
+        """
+        Return the expression in the buffer as one string
+        
+        This is the same text as the display shows, without asking the
+        display for it.
+        """
+        return "".join(self._buffer)
+    
+    
+    def _set_display(self, text):
+        """
+        Replace the whole expression (buffer and display) with text
+        
+        The display is only updated if its text actually changes: e.g.
+        calculating "Error" again, or "8" when the display already shows
+        8, costs no call to Tk. Without a display (headless engine) only
+        the buffer is replaced.
+        """
+        if text != self.input_text():
+            if self.display_var is not None:
+                # One call to Tk through the display's text variable
+                self.display_var.set(text)
+                # Setting the variable leaves the cursor where it was (unless
+                # the text got shorter); input is added at the end, so the
+                # cursor is moved there like after an insert
+                if self.display is not None:
+                    self.display.icursor(tk.END)
+            elif self.display is not None:
+                # A display without a text variable: delete, then insert
+                self.display.delete(0, tk.END)
+                self.display.insert(0, text)
+        self._buffer = [text]
     
     
     # =====================
@@ -53,24 +615,16 @@ class CalculatorEngine:
     
     def calculate(self):
         """
-        Evaluate the mathematical expression entered by the user
+        Evaluate the expression shown on the display and show the result
         
         This method performs the complete calculation process:
-        1. Retrieves the expression from the display screen
-        2. Converts calculator symbols to Python operators
-        3. Transforms mathematical functions using regex
-        4. Evaluates the final expression
-        5. Displays the result or an error message
-        
-        Supported operations:
-        ---------------------
-        - Basic arithmetic: +, -, ×, ÷
-        - Exponents: x^y (converted to x**y)
-        - Square roots: √25 or √(25)
-        - Nth roots: √(n,x) means nth root of x
-        - Trigonometry: sin, cos, tan (input in degrees)
-        - Inverse trig: asin, acos, atan (output in degrees)
-        - Logarithm: log(x) base 10
+        1. Takes the expression from the expression buffer, which holds
+           the same text as the display (stops here if it is empty or
+           already is the last result)
+        2. Evaluates it with evaluate_expression()
+           (or reuses the cached value of a recent expression)
+        3. Saves the result for the Ans button
+        4. Displays the result or an error message
         
         Error handling:
         ---------------
@@ -79,215 +633,181 @@ class CalculatorEngine:
         """
         try:
             # =====================
-            # Step 1: Get expression from display
+            # Step 1: Get the expression
             # =====================
             
-            # Retrieve the current text from the display screen
+            # The expression buffer holds the same text as the display
             # This is what the user has typed (e.g., "5×3+√25")
-            expr = self.display.get()
-            
-            
-            # =====================
-            # Step 2: Replace calculator symbols with Python operators
-            # =====================
-            
-            # Convert multiplication symbol × to Python's *
-            # Convert division symbol ÷ to Python's /
-            # Example: "5×3÷2" becomes "5*3/2"
-            expr = expr.replace("×", "*").replace("÷", "/")
-            
-            
-            # =====================
-            # Step 3: Handle exponentiation (power)
-            # =====================
-            
-            # Convert power symbol ^ into Python's exponent operator **
-            # Example: "2^3" becomes "2**3" which evaluates to 8
-            expr = expr.replace("^", "**")
-            
-            
-            # =====================
-            # Step 4: Handle general nth root format √(n,x)
-            # =====================
-            
-            # Regex pattern breakdown for general root format √(n, x):
-            # √\(        : matches the '√' symbol followed by an opening parenthesis
-            # \s*        : matches any optional whitespace (spaces/tabs)
-            # ([^,]+)    : captures the first number (n = root degree) before the comma
-            #              [^,]+ means "one or more characters that are NOT a comma"
-            # \s*,\s*    : matches the comma separating the numbers, with optional spaces
-            # ([^)]+)    : captures the second number (x = number to take root of)
-            #              [^)]+ means "one or more characters that are NOT a closing parenthesis"
-            # \s*\)      : matches any optional whitespace before the closing parenthesis
-            #
-            # Replacement: (\2 ** (1/\1))
-            # Mathematical formula: nth root of x = x^(1/n)
-            # \2 refers to the second captured group (x)
-            # \1 refers to the first captured group (n)
-            #
-            # Example:
-            # √(3,27) → (27 ** (1/3)) → 3.0 (cube root of 27)
-            # √(2,16) → (16 ** (1/2)) → 4.0 (square root of 16)
-            
-            expr = re.sub(
-                r'√\(\s*([^,]+)\s*,\s*([^)]+)\s*\)',
-                r'(\2 ** (1/\1))',
-                expr
-            )
-            
-            
-            # =====================
-            # Step 5: Handle square root format √25 or √(25)
-            # =====================
-            
-            # Regex pattern breakdown for square root format √number:
-            # √\(?       : matches the '√' symbol, optionally followed by opening parenthesis
-            #              \(? means "zero or one opening parenthesis"
-            # ([0-9.]+)  : captures the number itself
-            #              [0-9.]+ means "one or more digits or decimal points"
-            #              This allows both integers (25) and decimals (25.5)
-            # \)?        : optionally matches a closing parenthesis after the number
-            #
-            # Replacement: math.sqrt(\1)
-            # Converts to Python's square root function
-            # \1 refers to the captured number
-            #
-            # This pattern allows flexible input:
-            # √25   → math.sqrt(25)   → 5.0
-            # √(25) → math.sqrt(25)   → 5.0
-            # √9.5  → math.sqrt(9.5)  → 3.082...
-            
-            expr = re.sub(r'√\(([^)]+)\)', r'math.sqrt(\1)', expr)
-
-            
-            
-            # =====================
-            # Step 6: Handle trigonometric functions (input in degrees)
-            # =====================
-            
-            # Python's math.sin, math.cos, math.tan work with radians
-            # But calculators typically use degrees for user convenience
-            # So we convert: degrees → radians → calculate → result
-            
-            # Sine function: sin(angle_in_degrees)
-            # Pattern: sin\(([^)]+)\) captures everything inside sin(...)
-            # Replacement: math.sin(math.radians(\1))
-            # Example: sin(30) → math.sin(math.radians(30)) → 0.5
-            expr = re.sub(r'sin\(([^)]+)\)', r'math.sin(math.radians(\1))', expr)
-            
-            # Cosine function: cos(angle_in_degrees)
-            # Example: cos(60) → math.cos(math.radians(60)) → 0.5
-            expr = re.sub(r'cos\(([^)]+)\)', r'math.cos(math.radians(\1))', expr)
-            
-            # Tangent function: tan(angle_in_degrees)
-            # Example: tan(45) → math.tan(math.radians(45)) → 1.0
-            expr = re.sub(r'tan\(([^)]+)\)', r'math.tan(math.radians(\1))', expr)
+            # Joining it in Python avoids a round trip to Tk to read the display
+            expr = "".join(self._buffer)
             
-            
-            # =====================
-            # Step 7: Handle inverse trigonometric functions (output in degrees)
-            # =====================
-            
-            # Python's math.asin, math.acos, math.atan return radians
-            # But we want to display the result in degrees
-            # So we convert: calculate in radians → convert to degrees → result
-            
-            # Inverse sine (arcsin): asin(value) returns angle in degrees
-            # Pattern: asin\(([^)]+)\) captures the value inside asin(...)
-            # Replacement: math.degrees(math.asin(\1))
-            # Example: asin(0.5) → math.degrees(math.asin(0.5)) → 30.0 degrees
-            expr = re.sub(r'asin\(([^)]+)\)', r'math.degrees(math.asin(\1))', expr)
-            
-            # Inverse cosine (arccos): acos(value) returns angle in degrees
-            # Example: acos(0.5) → math.degrees(math.acos(0.5)) → 60.0 degrees
-            expr = re.sub(r'acos\(([^)]+)\)', r'math.degrees(math.acos(\1))', expr)
-            
-            # Inverse tangent (arctan): atan(value) returns angle in degrees
-            # Example: atan(1) → math.degrees(math.atan(1)) → 45.0 degrees
-            expr = re.sub(r'atan\(([^)]+)\)', r'math.degrees(math.atan(\1))', expr)
+            # Nothing to do if the display is empty, or if it already shows
+            # the last result (e.g. when '=' is pressed several times in a row)
+            if not expr or expr == self.last_answer:
+                return
             
             
             # =====================
-            # Step 8: Handle logarithm function (base 10)
+            # Step 2: Evaluate the expression
             # =====================
             
-            # Regex pattern breakdown for logarithm function log(x):
-            # log\(      : matches the literal text 'log('
-            # ([^)]+)    : captures everything inside the parentheses (the argument x)
-            #              [^)]+ means "one or more characters that are NOT a closing parenthesis"
-            # \)         : matches the closing parenthesis
-            #
-            # Replacement: math.log10(\1)
-            # Converts the user input log(x) into Python's math.log10(x)
-            # This calculates the logarithm base 10
-            #
-            # Mathematical note: log₁₀(x) answers "10 to what power equals x?"
-            #
-            # Examples:
-            # log(100)  → math.log10(100)  → 2.0   (because 10² = 100)
-            # log(1000) → math.log10(1000) → 3.0   (because 10³ = 1000)
-            # log(10)   → math.log10(10)   → 1.0   (because 10¹ = 10)
-            
-            expr = re.sub(r'log\(([^)]+)\)', r'math.log10(\1)', expr)
-            
-            
-            # =====================
-            # Step 9: Evaluate the final expression
-            # =====================
-            
-            # At this point, all calculator symbols and functions have been
-            # converted to valid Python code. Now we can safely evaluate it.
-            # 
-            # Example transformation:
-            # User input:  "sin(30)+√25×2"
-            # After step 2-8: "math.sin(math.radians(30))+math.sqrt(25)*2"
-            # Evaluation: 0.5 + 5.0 * 2 = 10.5
-            
-            result = eval(expr)
+            # All symbol conversion and evaluation happens in evaluate_expression
+            # Example: "5×3+√(25)" → 20.0
+            # If the same expression was calculated recently (e.g. rebuilt
+            # with Ans), its value is taken from the result cache instead
+            # of being evaluated again
+            cache = self._result_cache
+            if expr in cache:
+                cache.move_to_end(expr)
+                result = cache[expr]
+            else:
+                result = self.evaluate_expression(expr)
+                cache[expr] = result
+                if len(cache) > _RESULT_CACHE_SIZE:
+                    cache.popitem(last=False)   # Forget the oldest result
             
             
             # =====================
-            # Step 10: Save the result for the Ans button
+            # Step 3: Save the result for the Ans button
             # =====================
             
-            # Store the result as a string in last_answer
+            # Store the result as a string in last_answer (formatted once,
+            # the same text is shown on the display in step 4)
             # This allows the user to recall this result later using the "Ans" button
             # Example: If user calculates "5+3" = 8, then "Ans×2" = 16
-            self.last_answer = str(result)
+            self.last_answer = _format_result(result)
             
             
             # =====================
-            # Step 11: Display the result on screen
+            # Step 4: Display the result on screen
             # =====================
             
-            # Clear the current display (remove the expression)
-            self.display.delete(0, tk.END)
-            
-            # Insert the calculated result
-            # The result appears in the same place where the expression was
-            self.display.insert(0, result)
+            # Replace the expression with the calculated result
+            # Setting the display's text variable does this with a single
+            # call to Tk (instead of a delete followed by an insert)
+            # The result replaces the expression in the buffer as well,
+            # so the next key press continues from the result
+            self._set_display(self.last_answer)
         
         
-        except:
+        except (SyntaxError, NameError, TypeError, ValueError, ArithmeticError):
             # =====================
             # Error handling
             # =====================
             
-            # If ANY error occurs during the calculation process, we catch it here
-            # Possible errors include:
-            # - SyntaxError: Invalid mathematical expression (e.g., "5++3")
+            # If an invalid expression is calculated, we catch the error here
+            # The possible errors are:
+            # - SyntaxError: Invalid mathematical expression (e.g., "5×÷3")
             # - ZeroDivisionError: Division by zero (e.g., "5÷0")
+            # - OverflowError: Result too large (e.g., "10.0^400")
+            #   (both are ArithmeticError subclasses)
             # - ValueError: Invalid domain for functions (e.g., "√(-1)" or "log(-5)")
             # - NameError: Undefined variable or function
             # - TypeError: Wrong type of argument
+            #
+            # Other exceptions (such as KeyboardInterrupt or SystemExit)
+            # are not caught, so Ctrl-C still stops the program
             
-            # Clear the display
-            self.display.delete(0, tk.END)
-            
-            # Show generic "Error" message to the user
+            # Show generic "Error" message to the user (replacing the expression
+            # on the display and in the expression buffer)
             # We use a generic message rather than showing technical error details
             # to keep the interface simple and user-friendly
-            self.display.insert(0, "Error")
+            self._set_display("Error")
+    
+    
+    # =====================
+    # Expression evaluation method
+    # =====================
+    
+    def evaluate_expression(self, expr):
+        """
+        Evaluate a calculator expression
+        
+        This method does not touch the display, so it can also be used
+        without a GUI (for example by the unit tests in testing.py).
+        
+        Parameters:
+        -----------
+        expr : str
+            The expression as typed by the user (e.g., "5×3+√(25)")
+        
+        Returns:
+        --------
+        result : int or float
+            The value of the expression
+        
+        Supported operations:
+        ---------------------
+        - Basic arithmetic: +, -, ×, ÷
+        - Exponents: x^y
+        - Square roots: √25 or √(25)
+        - Nth roots: √(n,x) means nth root of x
+        - Trigonometry: sin, cos, tan (input in degrees)
+        - Inverse trig: asin, acos, atan (output in degrees)
+        - Logarithm: log(x) base 10
+        
+        Raises:
+        -------
+        Any exception raised while evaluating an invalid expression
+        (SyntaxError, ZeroDivisionError, ValueError, ...)
+        """
+        
+        # =====================
+        # Step 1: Canonicalize the expression
+        # =====================
+        
+        # Remove all whitespace, so "2 + 3" and "2+3" share one cached
+        # value in step 2
+        expr = _canonicalize(expr)
+        
+        
+        # =====================
+        # Step 2: Evaluate the expression
+        # =====================
+        
+        # _Parser reads the calculator notation directly, in one pass:
+        # - × and ÷ (or * and /) are multiplication and division
+        # - ^ (or **) is the power operator     (e.g. "2^3"     → 8)
+        # - √x and √(x) are square roots        (e.g. "√25"     → 5.0)
+        # - √(n,x) is the nth root of x         (e.g. "√(3,27)" → 3.0)
+        # - sin, asin, log, ... are the functions in _EVAL_GLOBALS
+        #   (degree-based trigonometry and the base 10 logarithm)
+        # Any other name raises an error. _evaluate caches the value of
+        # repeated expressions.
+        # 
+        # Example:
+        # User input:  "sin(30)+√(25)×2"
+        # Evaluation: 0.5 + 5.0 * 2 = 10.5
+        
+        return _evaluate(expr)
+    
+    
+    # =====================
+    # Evaluation of several expressions
+    # =====================
+    
+    def evaluate_many(self, expressions):
+        """
+        Evaluate many calculator expressions (for scripts and tests)
+        
+        A shorthand for calling evaluate_expression() on each expression,
+        so each result or error is exactly the one '=' would give.
+        
+        Parameters:
+        -----------
+        expressions : iterable of str
+            Expressions as typed by the user (e.g., ["2+3", "√25"])
+        
+        Returns:
+        --------
+        results : list
+            The value of each expression, in the same order
+        
+        Raises:
+        -------
+        The same errors as evaluate_expression for invalid expressions
+        """
+        return [self.evaluate_expression(expr) for expr in expressions]
     
     
     # =====================
@@ -299,8 +819,8 @@ class CalculatorEngine:
         Insert the last calculated answer into the current expression
         
         This method is called when the user presses the "Ans" button.
-        It retrieves the last calculation result and inserts it at the
-        current cursor position in the display.
+        It retrieves the last calculation result and appends it to the end
+        of the current expression, where all input is added.
         
         Use case:
         ---------
@@ -317,12 +837,143 @@ class CalculatorEngine:
         # Insert the last answer at the end of the current expression
         # tk.END means "insert at the end of whatever is currently displayed"
         # If last_answer is empty, nothing visible happens (empty string inserted)
-        self.display.insert(tk.END, self.last_answer)
+        self._buffer.append(self.last_answer)
+        if self.display is not None:
+            self.display.insert(tk.END, self.last_answer)
 
 # =====================
 # GUI Class
 # =====================
 
+# Keys the display lets tkinter handle as usual: they only move the
+# keyboard focus or are modifiers of a following key (e.g. Ctrl for Ctrl+C).
+# Cursor keys (Left, Right, Home, End) are not among them: every edit
+# happens at the end of the expression, so the cursor stays there
+_PASS_THROUGH_KEYS = frozenset({"Tab", "Shift_L", "Shift_R", "Control_L", "Control_R"})
+
+# Bit of event.state that is set while the Control key is held down
+_CONTROL_MASK = 0x0004
+
+# Bits of event.state for the modifiers that turn a key into a shortcut
+# (Ctrl+C, Alt+F, Cmd+C, ...) instead of typing its character, for each
+# windowing system ("tk windowingsystem"). Tk's own Entry bindings ignore
+# these keys too. NumLock also sets a bit (Mod2 on X11, Mod1 on Windows),
+# and Option (Mod2 on macOS) types characters, so those are not listed
+_SHORTCUT_MASKS = {
+    "x11": _CONTROL_MASK | 0x0008 | 0x0040,     # Control, Alt (Mod1), Super/Meta (Mod4)
+    "win32": _CONTROL_MASK | 0x20000,           # Control, Alt
+    "aqua": _CONTROL_MASK | 0x0008,             # Control, Command (Mod1)
+}
+
+# Keys that copy the selection when pressed with a shortcut modifier
+# (Ctrl+C, Cmd+C, Ctrl+Insert); copying does not change the display
+_COPY_KEYS = frozenset({"c", "C", "Insert"})
+
+# Binding tag shared by all calculator buttons (for the hover effect)
+_HOVER_TAG = "CalcButton"
+
+# Options that are the same for every calculator button, passed to the
+# tk.Button constructor and to grid() by create_button
+_BUTTON_STYLE = {
+    "font": ("Arial", 14, "bold"),  # Font: Arial, size 14, bold for clarity
+    "width": 6,                     # Button width (in character units)
+    "height": 2,                    # Button height (in character units)
+    "relief": "flat",               # Flat appearance (modern, minimalist style)
+    "borderwidth": 0,               # Remove default border for cleaner look
+}
+_BUTTON_GRID = {
+    "padx": 6,          # Horizontal padding (6 pixels space between buttons)
+    "pady": 6,          # Vertical padding (6 pixels space between buttons)
+    "sticky": "nsew",   # Stretch button to fill entire grid cell (north-south-east-west)
+}
+
+# Entries that the C button removes as one unit (longer names first,
+# so "asin(" is found before "sin(")
+_ENTRY_SUFFIXES = ("asin(", "acos(", "atan(", "sin(", "cos(", "tan(", "log(", "pi")
+
+# Layout of every calculator button, used by CalculatorGUI.create_buttons:
+# (text, row, column, handler, argument, color, colspan)
+# - handler is the name of the method the button calls (see create_buttons)
+# - argument is passed to the handler (the text that press() inserts),
+#   or None for handlers without an argument
+# - color is NUM (digits), OP (operators and functions) or EQ (equals)
+_BUTTON_SPECS = (
+    # =====================
+    # Row 2: Top control buttons
+    # =====================
+    # AC clears everything (including Ans), C removes the last entry
+    # (a whole function name at once), DEL removes one character
+    ("AC",   2, 0, "clear_all",   None,    "OP",  1),
+    ("C",    2, 1, "clear_entry", None,    "OP",  1),
+    ("DEL",  2, 2, "delete_last", None,    "OP",  1),
+    ("÷",    2, 3, "press",       "÷",     "OP",  1),
+    
+    # =====================
+    # Rows 3-5: Number pad and basic operators
+    # =====================
+    # Standard calculator layout: 7-8-9, 4-5-6, 1-2-3
+    # Each row includes its corresponding operator (×, -, +)
+    ("7",    3, 0, "press",       "7",     "NUM", 1),
+    ("8",    3, 1, "press",       "8",     "NUM", 1),
+    ("9",    3, 2, "press",       "9",     "NUM", 1),
+    ("×",    3, 3, "press",       "×",     "OP",  1),
+    ("4",    4, 0, "press",       "4",     "NUM", 1),
+    ("5",    4, 1, "press",       "5",     "NUM", 1),
+    ("6",    4, 2, "press",       "6",     "NUM", 1),
+    ("-",    4, 3, "press",       "-",     "OP",  1),
+    ("1",    5, 0, "press",       "1",     "NUM", 1),
+    ("2",    5, 1, "press",       "2",     "NUM", 1),
+    ("3",    5, 2, "press",       "3",     "NUM", 1),
+    ("+",    5, 3, "press",       "+",     "OP",  1),
+    
+    # =====================
+    # Row 6: Zero, decimal point, comma, and power
+    # =====================
+    # The comma is used in √(3,27) for nth roots
+    # xʸ inserts the ^ symbol for exponentiation
+    ("0",    6, 0, "press",       "0",     "NUM", 1),
+    (".",    6, 1, "press",       ".",     "NUM", 1),
+    (",",    6, 2, "press",       ",",     "OP",  1),
+    ("xʸ",   6, 3, "power",       None,    "OP",  1),
+    
+    # =====================
+    # Row 7: Roots, constants, and parentheses
+    # =====================
+    # √ can be used as √25, √(25) or √(3,27) for nth root
+    ("√",    7, 0, "press",       "√",     "OP",  1),
+    ("π",    7, 1, "insert_pi",   None,    "OP",  1),
+    ("(",    7, 2, "press",       "(",     "OP",  1),
+    (")",    7, 3, "press",       ")",     "OP",  1),
+    
+    # =====================
+    # Row 8: Trigonometric functions and logarithm
+    # =====================
+    # All trigonometric functions work with degrees (not radians)
+    # Examples: sin(30) → 0.5, cos(60) → 0.5, tan(45) → 1.0
+    # log is base 10: log(100) → 2.0
+    ("sin",  8, 0, "press",       "sin(",  "OP",  1),
+    ("cos",  8, 1, "press",       "cos(",  "OP",  1),
+    ("tan",  8, 2, "press",       "tan(",  "OP",  1),
+    ("log",  8, 3, "press",       "log(",  "OP",  1),
+    
+    # =====================
+    # Row 9: Inverse trigonometric functions and Ans button
+    # =====================
+    # Inverse trig functions return angles in degrees
+    # Examples: asin(0.5) → 30, acos(0.5) → 60, atan(1) → 45
+    # Ans inserts the result of the last calculation
+    ("asin", 9, 0, "press",       "asin(", "OP",  1),
+    ("acos", 9, 1, "press",       "acos(", "OP",  1),
+    ("atan", 9, 2, "press",       "atan(", "OP",  1),
+    ("Ans",  9, 3, "insert_ans",  None,    "OP",  1),
+    
+    # =====================
+    # Row 10: Equals button (spans all 4 columns)
+    # =====================
+    # Uses the darker EQUAL_COLOR to stand out
+    ("=",   10, 0, "calculate",   None,    "EQ",  4),
+)
+
 class CalculatorGUI:
     """
     Graphical User Interface Class - Handles all tkinter-related components
@@ -335,7 +986,7 @@ class CalculatorGUI:
         Initialize the Calculator GUI
         This method sets up all the essential components of the calculator interface:
         1. Define color scheme for buttons
-        2. Create the main window
+        2. Create the main window (and the shared button hover effect)
         3. Create the display screen
         4. Initialize the calculation engine
         5. Create all calculator buttons
@@ -357,11 +1008,14 @@ class CalculatorGUI:
         # Step 1: Create and configure the main calculator window
         self.setup_window()
         
+        # Step 1b: Register the hover effect shared by all buttons
+        self.bind_hover_effect()
+        
         # Step 2: Create the display screen where expressions and results appear
         self.create_display()
         
         # Step 3: Initialize the calculation engine and connect it to the display
-        self.engine = CalculatorEngine(self.display)
+        self.engine = CalculatorEngine(self.display, self.display_var)
         
         # Step 4: Create all calculator buttons (numbers, operators, functions)
         self.create_buttons()
@@ -396,6 +1050,37 @@ class CalculatorGUI:
         self.root.resizable(False, False)
     
     
+    # =====================
+    # Hover effect method
+    # =====================
+    
+    def bind_hover_effect(self):
+        """
+        Register the hover effect for all calculator buttons at once
+        
+        The <Enter>/<Leave> handlers are bound to the "CalcButton" binding
+        tag instead of to every single button, so there is one pair of
+        handlers (and two bind calls) for the whole keypad. create_button
+        adds the tag to each button. The handlers are Tcl procs, which skips
+        the Tcl → Python → Tcl round trip on every hover.
+        """
+        
+        # The hover effect gives visual feedback when the mouse is over a
+        # button: raised while the cursor is inside, flat again when it leaves.
+        # The handlers are plain Tcl procs, so hovering never calls back into
+        # Python; %W is replaced by Tk with the path of the button under the mouse
+        self.root.tk.eval(
+            "proc _calc_enter {w} { $w configure -relief raised }\n"
+            "proc _calc_leave {w} { $w configure -relief flat }"
+        )
+        
+        # Bind the hover procs to mouse events:
+        # <Enter> event triggers when mouse cursor enters button area
+        # <Leave> event triggers when mouse cursor exits button area
+        self.root.bind_class(_HOVER_TAG, "<Enter>", "_calc_enter %W")
+        self.root.bind_class(_HOVER_TAG, "<Leave>", "_calc_leave %W")
+    
+    
     # =====================
     # Display creation method
     # =====================
@@ -415,9 +1100,14 @@ class CalculatorGUI:
         - Positioned at the top of the calculator spanning all 4 columns
         """
         
+        # The text shown on the display; replacing the whole text
+        # (e.g. with a result) is a single set() call
+        self.display_var = tk.StringVar(self.root)
+        
         # Create an Entry widget to serve as the calculator's display screen
         self.display = tk.Entry(
             self.root,                  # Parent widget (main window)
+            textvariable=self.display_var,  # Text shown on the display
             font=("Arial", 24),         # Large font for better visibility
             justify="right",            # Right-align text (standard calculator behavior)
             bd=10                       # Border width of 10 pixels for visual separation
@@ -428,6 +1118,36 @@ class CalculatorGUI:
         # - Column 0, spanning across all 4 columns
         # - Padding: 10 pixels on all sides
         self.display.grid(row=1, column=0, columnspan=4, padx=10, pady=10)
+        
+        # Appending text is the most frequent display update (every button
+        # press), so the Tcl command is prepared once: calling
+        # self._insert(text) runs "<entry path> insert end text" directly,
+        # skipping the argument handling of the Entry.insert wrapper
+        self._insert = partial(self.display.tk.call, self.display._w, "insert", "end")
+        
+        # Keys typed into the display go through the same handlers as the
+        # buttons, so the engine's expression buffer always matches the display
+        # The modifier bits that mark a shortcut depend on the platform
+        self._shortcut_mask = _SHORTCUT_MASKS.get(
+            self.root.tk.call("tk", "windowingsystem"), _CONTROL_MASK)
+        self.display.bind("<Key>", self.on_key)
+        
+        # Pasting (Ctrl+V or the middle mouse button) would change the display
+        # behind the buffer's back, so it is ignored
+        def ignore(event):
+            return "break"
+        
+        self.display.bind("<<Paste>>", ignore)
+        self.display.bind("<<PasteSelection>>", ignore)
+        
+        # Input is always added at the end of the expression, so the cursor
+        # is put back there whenever a click (e.g. to select text for
+        # copying) or getting the focus could have moved it elsewhere
+        def cursor_to_end(event):
+            self.display.icursor(tk.END)
+        
+        self.display.bind("<ButtonRelease-1>", cursor_to_end)
+        self.display.bind("<FocusIn>", cursor_to_end)
     
     
     # =====================
@@ -440,7 +1160,8 @@ class CalculatorGUI:
         
         This method creates individual buttons for the calculator with:
         - Custom colors based on button type (number/operator)
-        - Hover effect (shadow appears when mouse enters button area)
+        - Hover effect (shadow appears when mouse enters button area,
+          through the shared "CalcButton" binding tag)
         - Consistent size and styling across all buttons
         - Grid-based positioning for organized layout
         
@@ -470,44 +1191,23 @@ class CalculatorGUI:
         # Create the button widget
         # =====================
         
+        # The options shared by all buttons come from _BUTTON_STYLE; only
+        # the text, color and command differ from button to button
         button = tk.Button(
             self.root,                     # Parent widget (main window)
             text=text,                     # Text label displayed on the button
-            font=("Arial", 14, "bold"),    # Font: Arial, size 14, bold for clarity
-            width=6,                       # Button width (in character units)
-            height=2,                      # Button height (in character units)
             highlightbackground=bg,        # Background color (differs for numbers vs operators)
             activebackground=bg,           # Keep same color when button is pressed
-            relief="flat",                 # Flat appearance (modern, minimalist style)
-            borderwidth=0,                 # Remove default border for cleaner look
-            command=cmd                    # Function to execute when clicked
+            command=cmd,                   # Function to execute when clicked
+            **_BUTTON_STYLE
         )
         
         # =====================
-        # Hover effect implementation
+        # Hover effect
         # =====================
-        # These functions create a visual feedback when mouse hovers over button
-        # This improves user experience by showing which button will be pressed
-        
-        def on_enter(event):
-            """
-            Mouse enters button area → add raised shadow effect
-            This gives visual feedback that the button is interactive
-            """
-            button.config(relief="raised")
-        
-        def on_leave(event):
-            """
-            Mouse leaves button area → remove shadow (return to flat)
-            Button returns to its normal flat appearance
-            """
-            button.config(relief="flat")
-        
-        # Bind the hover functions to mouse events:
-        # <Enter> event triggers when mouse cursor enters button area
-        # <Leave> event triggers when mouse cursor exits button area
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
+        # Adding the "CalcButton" tag gives the button the shared hover
+        # bindings created once in bind_hover_effect()
+        button.bindtags(button.bindtags() + (_HOVER_TAG,))
         
         # =====================
         # Position button in the grid layout
@@ -517,9 +1217,7 @@ class CalculatorGUI:
             row=r,              # Row position in grid
             column=c,           # Column position in grid
             columnspan=colspan, # Number of columns to span (1 for most buttons, 4 for '=')
-            padx=6,             # Horizontal padding (6 pixels space between buttons)
-            pady=6,             # Vertical padding (6 pixels space between buttons)
-            sticky="nsew"       # Stretch button to fill entire grid cell (north-south-east-west)
+            **_BUTTON_GRID      # Padding and stretching shared by all buttons
         )
         
         return button
@@ -529,6 +1227,47 @@ class CalculatorGUI:
     # Input handling methods
     # =====================
     
+    def on_key(self, event):
+        """
+        Handle a key typed while the display has the keyboard focus
+        
+        - Enter calculates the result (same as '=')
+        - BackSpace deletes the last character (same as DEL)
+        - Shortcuts (keys held with Control, Alt or Command) never type
+          their character; copying (Ctrl+C, Cmd+C) works as usual and
+          every other shortcut is ignored
+        - Any other printable character is added like a button press
+        - Tab (moving the focus) works as usual
+        - Every other key (Delete, Left, Home, ...) is ignored,
+          because it would change the display or move the cursor away
+          from the end, where all input is added
+        
+        Parameters:
+        -----------
+        event : tk.Event
+            The key event from tkinter
+        
+        Returns:
+        --------
+        "break" to stop tkinter's default handling of the key,
+        or None to let it run
+        """
+        keysym = event.keysym
+        if event.state & self._shortcut_mask:
+            if keysym in _COPY_KEYS:
+                return None     # Let tkinter copy the selected text
+            return "break"
+        if keysym in ("Return", "KP_Enter"):
+            self.engine.calculate()
+        elif keysym == "BackSpace":
+            self.delete_last()
+        elif event.char and event.char.isprintable():
+            self.press(event.char)
+        elif keysym in _PASS_THROUGH_KEYS:
+            return None     # Let tkinter move the focus
+        return "break"
+    
+    
     def press(self, value):
         """
         Insert a value into the display screen
@@ -545,7 +1284,8 @@ class CalculatorGUI:
         --------
         If display shows "5+3" and user clicks "2", display becomes "5+32"
         """
-        self.display.insert(tk.END, value)
+        self.engine.append_input(value)
+        self._insert(value)
     
     
     def clear_all(self):
@@ -559,8 +1299,9 @@ class CalculatorGUI:
         This is typically used when starting a completely new calculation
         or when user wants to clear everything and start fresh.
         """
-        # Delete all characters from the display (from position 0 to END)
-        self.display.delete(0, tk.END)
+        # Delete all characters from the display and from the expression buffer
+        # (both are replaced together by the engine)
+        self.engine.clear_input()
         
         # Reset the last answer stored in the engine (used by Ans button)
         self.engine.last_answer = ""
@@ -571,7 +1312,8 @@ class CalculatorGUI:
         Clear the last entry (number or function) - C button
         
         This is a "smart delete" that removes:
-        - Complete function names (sin(, cos(, log(, etc.) as one unit
+        - Complete function names (sin(, cos(, log(, etc.) and the
+          constant pi as one unit
         - OR the last single character if not a function
         
         This is more user-friendly than deleting character by character
@@ -582,21 +1324,29 @@ class CalculatorGUI:
         Display: "5+sin("
         After C button: "5+"  (removes entire "sin(" not just the "(")
         """
-        # Get current text from display
-        text = self.display.get()
-        
-        # Check if the text ends with any known function name
-        # If found, remove the entire function as one unit
-        for func in ["asin(", "acos(", "atan(", "sin(", "cos(", "tan(", "log("]:
-            if text.endswith(func):
-                # Delete from (text length - function length) to END
-                # This removes the complete function name
-                self.display.delete(len(text)-len(func), tk.END)
-                return  # Exit after removing function
+        # Keep local references (one attribute lookup per call)
+        display = self.display
+        engine = self.engine
+        
+        # Get the current text from the expression buffer
+        text = engine.input_text()
+        
+        # Check if the text ends with any known function name (or pi)
+        # One endswith() call checks all of them; only then find out which
+        # one it was. If found, remove the entire function as one unit
+        if text.endswith(_ENTRY_SUFFIXES):
+            for func in _ENTRY_SUFFIXES:
+                if text.endswith(func):
+                    # Delete from (text length - function length) to END
+                    # This removes the complete function name
+                    display.delete(len(text)-len(func), tk.END)
+                    engine.remove_input(len(func))
+                    return  # Exit after removing function
         
         # If no function found and text exists, remove just the last character
         if text:
-            self.display.delete(len(text)-1, tk.END)
+            display.delete(len(text)-1, tk.END)
+            engine.remove_input(1)
     
     
     def delete_last(self):
@@ -607,43 +1357,48 @@ class CalculatorGUI:
         whether it's part of a number, operator, or function name.
         
         Implementation:
-        - Get current text
-        - Delete everything from display
-        - Re-insert text without the last character
+        - Get the length of the current text from the expression buffer
+        - Delete the last character from the display and the buffer
         
         Example:
         --------
         Display: "sin(45)"
         After DEL: "sin(4"
         """
-        # Get the current text from display
-        text = self.display.get()
+        # Keep a local reference to the engine (one attribute lookup per call)
+        engine = self.engine
         
-        # Clear the entire display
-        self.display.delete(0, tk.END)
+        # Get the current text from the expression buffer
+        text = engine.input_text()
         
-        # Re-insert the text without the last character (text[:-1] means all except last)
-        self.display.insert(0, text[:-1])
+        # Delete only the last character (nothing happens if the display is empty)
+        if text:
+            self.display.delete(len(text)-1, tk.END)
+            engine.remove_input(1)
     
     
     def insert_pi(self):
         """
         Insert the mathematical constant π (pi) into the display
         
-        When the π button is pressed, this method inserts the numerical
-        value of pi (approximately 3.14159265359) into the expression.
+        When the π button is pressed, this method inserts the name "pi"
+        into the expression. When the expression is calculated, "pi" is
+        replaced by Python's math.pi constant (see _EVAL_GLOBALS), which
+        provides full double precision.
         
-        The value is obtained from Python's math.pi constant which provides
-        high precision (typically 15-17 decimal places).
+        Inserting the name instead of the 17-digit value keeps the display
+        short, avoids converting the float to text and back, and lets the
+        value cache recognise repeated expressions.
         
         Example:
         --------
         User clicks: "2" → "×" → "π"
-        Display shows: "2×3.141592653589793"
+        Display shows: "2×pi"
         """
-        # Insert the value of pi at the end of current expression
-        # math.pi provides the most accurate value available in Python
-        self.display.insert(tk.END, str(math.pi))
+        # Insert the name of the constant at the end of current expression
+        # It is resolved to math.pi during evaluation
+        self.engine.append_input("pi")
+        self._insert("pi")
     
     
     def power(self):
@@ -661,7 +1416,8 @@ class CalculatorGUI:
         """
         # Insert the ^ symbol which represents exponentiation
         # This will be converted to ** during expression evaluation
-        self.display.insert(tk.END, "^")
+        self.engine.append_input("^")
+        self._insert("^")
     
     
     # =====================
@@ -670,10 +1426,12 @@ class CalculatorGUI:
     
     def create_buttons(self):
         """
-        Create all calculator buttons in organized rows
+        Create all calculator buttons from the _BUTTON_SPECS layout table
         
-        This method systematically creates every button on the calculator
-        in a logical order, organizing them by function:
+        Every button is described by one row of the table:
+        (text, row, column, handler, argument, color, colspan)
+        and all buttons are created by one loop over the table.
+        The table lists the buttons in a logical order:
         
         1. Control buttons (AC, C, DEL, ÷)
         2. Number pad (7-9, 4-6, 1-3, 0)
@@ -690,134 +1448,32 @@ class CalculatorGUI:
         - Dark blue (EQUAL_COLOR) for equals button
         """
         
-        # =====================
-        # Row 2: Top control buttons
-        # =====================
-        # These buttons control the display and basic division
-        
-        self.create_button("AC", 2, 0, self.clear_all, self.OP_COLOR)
-        # AC (All Clear): Clears entire display and resets last answer
-        
-        self.create_button("C", 2, 1, self.clear_entry, self.OP_COLOR)
-        # C (Clear Entry): Removes last entry (smart delete for functions)
-        
-        self.create_button("DEL", 2, 2, self.delete_last, self.OP_COLOR)
-        # DEL (Delete): Removes only the last single character
-        
-        self.create_button("÷", 2, 3, lambda: self.press("÷"), self.OP_COLOR)
-        # Division operator: ÷ symbol (will be converted to / during calculation)
-        
-        
-        # =====================
-        # Rows 3-5: Number pad and basic operators
-        # =====================
-        # Standard calculator layout: 7-8-9, 4-5-6, 1-2-3
-        # Each row includes its corresponding operator (×, -, +)
-        
-        # Define button layout as list of tuples: (text, row, column)
-        buttons = [
-            ("7",3,0), ("8",3,1), ("9",3,2), ("×",3,3),  # Row 3
-            ("4",4,0), ("5",4,1), ("6",4,2), ("-",4,3),  # Row 4
-            ("1",5,0), ("2",5,1), ("3",5,2), ("+",5,3),  # Row 5
-        ]
-        
-        # Loop through each button definition and create it
-        for text, r, c in buttons:
-            if text.isdigit():
-                # If button is a digit (0-9), use pink NUMBER_COLOR
-                self.create_button(text, r, c, lambda x=text: self.press(x), self.NUMBER_COLOR)
-            else:
-                # If button is an operator (×, -, +), use blue OP_COLOR
-                self.create_button(text, r, c, lambda x=text: self.press(x), self.OP_COLOR)
-        
-        
-        # =====================
-        # Row 6: Zero, decimal point, comma, and power
-        # =====================
-        
-        self.create_button("0", 6, 0, lambda: self.press("0"), self.NUMBER_COLOR)
-        # Zero button: Uses pink color like other numbers
-        
-        self.create_button(".", 6, 1, lambda: self.press("."), self.NUMBER_COLOR)
-        # Decimal point: Allows entry of decimal numbers (e.g., 3.14)
-        
-        self.create_button(",", 6, 2, lambda: self.press(","), self.OP_COLOR)
-        # Comma: Used in functions like √(3,27) for nth root
-        
-        self.create_button("xʸ", 6, 3, self.power, self.OP_COLOR)
-        # Power button: Inserts ^ symbol for exponentiation (x to the power of y)
-        
-        
-        # =====================
-        # Row 7: Roots, constants, and parentheses
-        # =====================
-        
-        self.create_button("√", 7, 0, lambda: self.press("√"), self.OP_COLOR)
-        # Square root symbol: Can be used as √25 or √(3,27) for nth root
-        
-        self.create_button("π", 7, 1, self.insert_pi, self.OP_COLOR)
-        # Pi constant: Inserts the value of π (approximately 3.14159...)
-        
-        self.create_button("(", 7, 2, lambda: self.press("("), self.OP_COLOR)
-        # Opening parenthesis: For grouping expressions and function arguments
-        
-        self.create_button(")", 7, 3, lambda: self.press(")"), self.OP_COLOR)
-        # Closing parenthesis: Completes grouped expressions
-        
-        
-        # =====================
-        # Row 8: Trigonometric functions and logarithm
-        # =====================
-        # All trigonometric functions work with degrees (not radians)
-        
-        self.create_button("sin", 8, 0, lambda: self.press("sin("), self.OP_COLOR)
-        # Sine function: Calculates sine of an angle in degrees
-        # Example: sin(30) → 0.5
-        
-        self.create_button("cos", 8, 1, lambda: self.press("cos("), self.OP_COLOR)
-        # Cosine function: Calculates cosine of an angle in degrees
-        # Example: cos(60) → 0.5
-        
-        self.create_button("tan", 8, 2, lambda: self.press("tan("), self.OP_COLOR)
-        # Tangent function: Calculates tangent of an angle in degrees
-        # Example: tan(45) → 1.0
-        
-        self.create_button("log", 8, 3, lambda: self.press("log("), self.OP_COLOR)
-        # Logarithm base 10: Calculates log₁₀(x)
-        # Example: log(100) → 2.0
-        
-        
-        # =====================
-        # Row 9: Inverse trigonometric functions and Ans button
-        # =====================
-        # Inverse trig functions return angles in degrees
-        
-        self.create_button("asin", 9, 0, lambda: self.press("asin("), self.OP_COLOR)
-        # Inverse sine (arcsin): Returns angle whose sine is the input
-        # Example: asin(0.5) → 30 degrees
-        
-        self.create_button("acos", 9, 1, lambda: self.press("acos("), self.OP_COLOR)
-        # Inverse cosine (arccos): Returns angle whose cosine is the input
-        # Example: acos(0.5) → 60 degrees
-        
-        self.create_button("atan", 9, 2, lambda: self.press("atan("), self.OP_COLOR)
-        # Inverse tangent (arctan): Returns angle whose tangent is the input
-        # Example: atan(1) → 45 degrees
-        
-        self.create_button("Ans", 9, 3, self.engine.insert_ans, self.OP_COLOR)
-        # Ans (Answer) button: Inserts the result of the last calculation
-        # Useful for chaining calculations without retyping results
-        
-        
-        # =====================
-        # Row 10: Equals button (spans all 4 columns)
-        # =====================
-        
-        self.create_button("=", 10, 0, self.engine.calculate, self.EQUAL_COLOR, colspan=4)
-        # Equals button: Triggers calculation of the expression
-        # - Spans across all 4 columns for easy access
-        # - Uses darker blue color (EQUAL_COLOR) to stand out
-        # - Calls engine.calculate() to evaluate the expression
+        # The methods the handler names in the table refer to
+        handlers = {
+            "press": self.press,
+            "clear_all": self.clear_all,
+            "clear_entry": self.clear_entry,
+            "delete_last": self.delete_last,
+            "insert_pi": self.insert_pi,
+            "power": self.power,
+            "insert_ans": self.engine.insert_ans,
+            "calculate": self.engine.calculate,
+        }
+        
+        # The colors the color names in the table refer to
+        colors = {
+            "NUM": self.NUMBER_COLOR,
+            "OP": self.OP_COLOR,
+            "EQ": self.EQUAL_COLOR,
+        }
+        
+        # Create every button with one loop over the table
+        # partial binds the button's text to press() without a lambda
+        for text, r, c, handler, argument, color, colspan in _BUTTON_SPECS:
+            cmd = handlers[handler]
+            if argument is not None:
+                cmd = partial(cmd, argument)
+            self.create_button(text, r, c, cmd, colors[color], colspan)
     
     
     # =====================
@@ -19,6 +19,13 @@ class TestCalculatorEngine(unittest.TestCase):
     def test_square_root(self):
         self.assertEqual(self.engine.evaluate_expression("√25"), 5)
 
+    def test_nth_root(self):
+        self.assertAlmostEqual(
+            self.engine.evaluate_expression("√(3,27)"),
+            3,
+            places=5
+        )
+
     def test_sin(self):
         self.assertAlmostEqual(
             self.engine.evaluate_expression("sin(30)"),
@@ -26,5 +33,83 @@ class TestCalculatorEngine(unittest.TestCase):
             places=5
         )
 
+    def test_sin_negative(self):
+        self.assertEqual(
+            self.engine.evaluate_expression("sin(-30)"),
+            -self.engine.evaluate_expression("sin(30)")
+        )
+        self.assertLess(self.engine.evaluate_expression("tan(-90)"), 0)
+
+    def test_pi(self):
+        self.assertAlmostEqual(
+            self.engine.evaluate_expression("2×pi"),
+            6.283185,
+            places=5
+        )
+
+    def test_asin(self):
+        self.assertAlmostEqual(
+            self.engine.evaluate_expression("asin(0.5)"),
+            30,
+            places=5
+        )
+
+    def test_asin_rounding(self):
+        self.assertEqual(
+            self.engine.evaluate_expression("asin(sin(8)^2+cos(8)^2)"),
+            90
+        )
+        with self.assertRaises(ValueError):
+            self.engine.evaluate_expression("asin(1.1)")
+        with self.assertRaises(ValueError):
+            self.engine.evaluate_expression("asin(1.0000000000001)")
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.engine.evaluate_expression("2+1÷0")
+
+    def test_whitespace(self):
+        self.assertEqual(self.engine.evaluate_expression(" 1 + 2 × 3 "), 7)
+        with self.assertRaises(SyntaxError):
+            self.engine.evaluate_expression("2 3")
+
+    def test_evaluate_many(self):
+        self.assertEqual(
+            self.engine.evaluate_many(["2+3", "-2^2", "2×(3+4)÷7", "√25"]),
+            [5, -4, 2, 5]
+        )
+        with self.assertRaises(ValueError):
+            self.engine.evaluate_many(["√(-1)"])
+
+    def test_large_int(self):
+        self.assertEqual(self.engine.evaluate_expression("10^400"), 10 ** 400)
+
+    def test_input_buffer(self):
+        for text in ["5", "×", "sin("]:
+            self.engine.append_input(text)
+        self.engine.remove_input(1)
+        self.assertEqual(self.engine.input_text(), "5×sin")
+        self.engine.remove_input(4)
+        self.assertEqual(self.engine.input_text(), "5")
+
+    def test_calculate_headless(self):
+        for text in ["5", "+", "3"]:
+            self.engine.append_input(text)
+        self.engine.calculate()
+        self.assertEqual(self.engine.last_answer, "8")
+        self.engine.append_input("×")
+        self.engine.insert_ans()
+        self.engine.calculate()
+        self.assertEqual(self.engine.input_text(), "64")
+
+    def test_ans_keeps_precision(self):
+        for text in ["1", "÷", "3"]:
+            self.engine.append_input(text)
+        self.engine.calculate()
+        for text in ["×", "3"]:
+            self.engine.append_input(text)
+        self.engine.calculate()
+        self.assertEqual(self.engine.last_answer, "1")
+
 if __name__ == "__main__":
     unittest.main()